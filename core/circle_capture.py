@@ -18,7 +18,9 @@ class CircleCapture:
     
     def __init__(self):
         self.save_directory = "screenshots/circles"
-        self.data_directory = "screenshots/circle_data"
+        # 与set_save_directory保持同一推导方式，
+        # 这样目录未变化时的早退才是真正的空操作
+        self.data_directory = os.path.join(self.save_directory, "circle_data")
         self.anti_alias_scale = 4  # 抗锯齿缩放倍数
         
         # 确保目录存在
@@ -27,6 +29,9 @@ class CircleCapture:
     
     def set_save_directory(self, directory: str):
         """设置保存目录"""
+        # 目录未变化时跳过，避免每次应用配置都重复mkdir两个目录
+        if directory == self.save_directory:
+            return
         self.save_directory = directory
         self.data_directory = os.path.join(directory, "circle_data")
         Path(self.save_directory).mkdir(parents=True, exist_ok=True)
@@ -401,26 +406,48 @@ class CircleCapture:
     def get_capture_statistics(self) -> Dict[str, Any]:
         """获取截图统计信息"""
         try:
-            # 统计文件数量
-            circle_files = list(Path(self.save_directory).glob("circle_*.png"))
-            combined_files = list(Path(self.save_directory).glob("circles_combined_*.png"))
-            data_files = list(Path(self.data_directory).glob("circle_detection_data_*.json"))
-            
-            # 计算总文件大小
+            # 单次scandir遍历同时完成分类计数和大小累加，
+            # 避免两次glob扫描加逐文件stat
+            circle_count = 0
+            combined_count = 0
+            data_count = 0
             total_size = 0
-            for file_path in circle_files + combined_files:
-                total_size += file_path.stat().st_size
-            
+
+            try:
+                with os.scandir(self.save_directory) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        if not name.endswith(".png"):
+                            continue
+                        if name.startswith("circles_combined_"):
+                            combined_count += 1
+                        elif name.startswith("circle_"):
+                            circle_count += 1
+                        else:
+                            continue
+                        total_size += entry.stat(follow_symlinks=False).st_size
+            except FileNotFoundError:
+                pass
+
+            try:
+                with os.scandir(self.data_directory) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        if name.startswith("circle_detection_data_") and name.endswith(".json"):
+                            data_count += 1
+            except FileNotFoundError:
+                pass
+
             return {
-                "total_circle_images": len(circle_files),
-                "total_combined_images": len(combined_files),
-                "total_data_files": len(data_files),
+                "total_circle_images": circle_count,
+                "total_combined_images": combined_count,
+                "total_data_files": data_count,
                 "total_file_size_bytes": total_size,
                 "total_file_size_mb": round(total_size / (1024 * 1024), 2),
                 "save_directory": self.save_directory,
                 "data_directory": self.data_directory
             }
-            
+
         except Exception as e:
             print(f"获取统计信息失败: {e}")
             return {}
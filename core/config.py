@@ -100,9 +100,10 @@ class ConfigManager:
     def save_config(self):
         """保存配置到文件"""
         try:
-            # 确保配置目录存在
-            self.config_path.parent.mkdir(parents=True, exist_ok=True)
-            
+            # 确保配置目录存在（热路径上目录几乎总是已存在，先stat再按需创建）
+            if not self.config_path.parent.is_dir():
+                self.config_path.parent.mkdir(parents=True, exist_ok=True)
+
             with open(self.config_path, 'w', encoding='utf-8') as f:
                 json.dump(self._config, f, indent=2, ensure_ascii=False)
         except Exception as e:
@@ -207,6 +208,22 @@ class ConfigManager:
     def get_hotkey(self, action: str) -> Optional[str]:
         """获取快捷键"""
         return self.get(f'hotkeys.{action}')
+
+    def get_hotkeys(self, defaults: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        """
+        批量获取快捷键配置
+
+        Args:
+            defaults: 默认值字典，配置中缺失或为空的键使用默认值
+
+        Returns:
+            合并默认值后的快捷键字典
+        """
+        hotkeys = dict(defaults) if defaults else {}
+        for action, hotkey in self._config.get('hotkeys', {}).items():
+            if hotkey:
+                hotkeys[action] = hotkey
+        return hotkeys
     
     def set_continuous_interval(self, interval: float):
         """设置连续截图间隔"""
@@ -5,6 +5,33 @@ from typing import Dict, Callable, Optional
 from pynput import keyboard
 from pynput.keyboard import GlobalHotKeys
 
+# 特殊键映射 - 基于Context7 pynput文档
+# 模块级常量，避免每次转换快捷键时重建映射表
+_SPECIAL_KEYS = {
+    'space': '<space>',
+    'enter': '<enter>',
+    'tab': '<tab>',
+    'esc': '<esc>',
+    'escape': '<esc>',
+    'backspace': '<backspace>',
+    'delete': '<delete>',
+    'home': '<home>',
+    'end': '<end>',
+    'page_up': '<page_up>',
+    'page_down': '<page_down>',
+    'up': '<up>',
+    'down': '<down>',
+    'left': '<left>',
+    'right': '<right>',
+}
+
+# 功能键映射
+for _i in range(1, 13):
+    _SPECIAL_KEYS[f'f{_i}'] = f'<f{_i}>'
+
+# 修饰键集合
+_MODIFIER_KEYS = frozenset({'ctrl', 'shift', 'alt', 'win', 'cmd'})
+
 
 class ModernHotkeyManager:
     """
@@ -32,46 +59,23 @@ class ModernHotkeyManager:
         
         # 分割快捷键
         parts = [part.strip() for part in hotkey_str.split('+')]
-        
-        # 特殊键映射 - 基于Context7 pynput文档
-        special_keys = {
-            'space': '<space>',
-            'enter': '<enter>',
-            'tab': '<tab>',
-            'esc': '<esc>',
-            'escape': '<esc>',
-            'backspace': '<backspace>',
-            'delete': '<delete>',
-            'home': '<home>',
-            'end': '<end>',
-            'page_up': '<page_up>',
-            'page_down': '<page_down>',
-            'up': '<up>',
-            'down': '<down>',
-            'left': '<left>',
-            'right': '<right>',
-        }
-        
-        # 功能键映射
-        for i in range(1, 13):
-            special_keys[f'f{i}'] = f'<f{i}>'
-        
+
         # 转换格式
         converted_parts = []
         for part in parts:
-            if part in ['ctrl', 'shift', 'alt', 'win', 'cmd']:
+            if part in _MODIFIER_KEYS:
                 # 修饰键加上尖括号
                 if part == 'win':
                     converted_parts.append('<cmd>')  # Windows键在pynput中是cmd
                 else:
                     converted_parts.append(f'<{part}>')
-            elif part in special_keys:
+            elif part in _SPECIAL_KEYS:
                 # 特殊键使用映射
-                converted_parts.append(special_keys[part])
+                converted_parts.append(_SPECIAL_KEYS[part])
             else:
                 # 普通字符键直接使用
                 converted_parts.append(part)
-        
+
         return '+'.join(converted_parts)
     
     def register_hotkey(self, hotkey_str: str, callback: Callable, description: str = ""):
@@ -226,10 +230,8 @@ class ModernHotkeyManager:
             modifiers = []
             main_keys = []
             
-            valid_modifiers = {'ctrl', 'shift', 'alt', 'win', 'cmd'}
-            
             for part in parts:
-                if part in valid_modifiers:
+                if part in _MODIFIER_KEYS:
                     modifiers.append(part)
                 else:
                     main_keys.append(part)
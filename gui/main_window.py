@@ -1,6 +1,7 @@
 """主GUI界面模块"""
 
 import threading
+import queue
 import os
 from pathlib import Path
 
@@ -70,6 +71,12 @@ class MainWindow:
         
         # 坐标记录器
         self.coordinate_recorder = CoordinateRecorder()
+
+        # 截图任务队列和常驻工作线程：按钮/快捷键只负责入队，
+        # PNG编码和磁盘写入都在工作线程完成，不阻塞调用方
+        self._capture_queue = queue.Queue()
+        self._capture_worker = threading.Thread(target=self._capture_worker_loop, daemon=True)
+        self._capture_worker.start()
         
         # 创建界面
         self.create_widgets()
@@ -428,6 +435,17 @@ class MainWindow:
         except:
             pass
     
+    def _capture_worker_loop(self):
+        """截图工作线程主循环，顺序执行入队的截图任务"""
+        while True:
+            task = self._capture_queue.get()
+            if task is None:
+                break
+            try:
+                task()
+            except Exception as e:
+                print(f"截图任务执行失败: {e}")
+
     def fullscreen_screenshot(self):
         """执行全屏截图"""
         def capture():
@@ -446,9 +464,9 @@ class MainWindow:
                     self.update_status("全屏截图失败！")
             except Exception as e:
                 self.update_status(f"全屏截图错误: {e}")
-        
-        # 在后台线程中执行截图
-        threading.Thread(target=capture, daemon=True).start()
+
+        # 交给截图工作线程执行
+        self._capture_queue.put(capture)
     
     def apply_region(self):
         """应用截图区域设置"""
@@ -526,9 +544,9 @@ class MainWindow:
                     self.update_status(f"{screenshot_type}截图失败！")
             except Exception as e:
                 self.update_status(f"截图错误: {e}")
-        
-        # 在后台线程中执行截图
-        threading.Thread(target=capture, daemon=True).start()
+
+        # 交给截图工作线程执行
+        self._capture_queue.put(capture)
     
     def toggle_continuous_screenshot(self):
         """切换连续截图状态"""
@@ -565,9 +583,8 @@ class MainWindow:
                     size_info = f"{result['size'][0]}×{result['size'][1]}像素"
                     status_msg = f"矩形截图: {filename} | {size_info} | {file_size_kb:.1f}KB"
                 
-                self.root.after(0, lambda: self.update_status(status_msg))
-                self.root.after(0, lambda: self.update_latest_screenshot_info(result))
-                self.root.after(0, self.update_file_count)
+                # 合并为单次after调用，减少连续截图时GUI线程的唤醒次数
+                self.root.after(0, self._apply_capture_update, status_msg, result)
             
             if use_custom_circle:
                 custom_circle_params = self.get_custom_circle_params()
@@ -692,14 +709,15 @@ class MainWindow:
             interval = config_manager.get_continuous_interval()
             self.interval_var.set(str(interval))
             
-            # 加载快捷键设置
-            single_hotkey = config_manager.get_hotkey("single_capture") or "ctrl+shift+s"
-            continuous_hotkey = config_manager.get_hotkey("start_continuous") or "ctrl+shift+c"
-            stop_hotkey = config_manager.get_hotkey("stop_continuous") or "ctrl+shift+x"
-            
-            self.single_hotkey_var.set(single_hotkey)
-            self.continuous_hotkey_var.set(continuous_hotkey)
-            self.stop_hotkey_var.set(stop_hotkey)
+            # 加载快捷键设置（批量读取并合并默认值）
+            hotkeys = config_manager.get_hotkeys({
+                "single_capture": "ctrl+shift+s",
+                "start_continuous": "ctrl+shift+c",
+                "stop_continuous": "ctrl+shift+x",
+            })
+            self.single_hotkey_var.set(hotkeys["single_capture"])
+            self.continuous_hotkey_var.set(hotkeys["start_continuous"])
+            self.stop_hotkey_var.set(hotkeys["stop_continuous"])
             
             # 加载圆形检测设置
             circle_enabled = config_manager.is_circle_detection_enabled()
@@ -736,6 +754,12 @@ class MainWindow:
         except Exception as e:
             self.update_status(f"加载设置失败: {e}")
     
+    def _apply_capture_update(self, status_msg: str, result: dict):
+        """在GUI线程中一次性应用截图后的全部界面更新"""
+        self.update_status(status_msg)
+        self.update_latest_screenshot_info(result)
+        self.update_file_count()
+
     def update_latest_screenshot_info(self, result: dict):
         """更新最新截图详情显示"""
         try:
@@ -808,9 +832,12 @@ class MainWindow:
         if self.is_continuous_capturing:
             self.stop_continuous_screenshot()
         
-        # 停止坐标记录
-        if hasattr(self, 'coordinate_recorder') and self.coordinate_recorder.is_recording():
-            self.coordinate_recorder.stop_recording()
+        # 停止坐标记录并释放常驻监听器
+        if hasattr(self, 'coordinate_recorder'):
+            self.coordinate_recorder.close()
+
+        # 通知截图工作线程退出
+        self._capture_queue.put(None)
         
         # 保存设置
         try:
@@ -884,11 +911,13 @@ class MainWindow:
                 messagebox.showerror("格式错误", error_msg)
                 return
             
-            # 检查快捷键冲突
-            hotkeys = [single_key, continuous_key, stop_key]
-            if len(set(hotkeys)) != len(hotkeys):
-                messagebox.showerror("错误", "快捷键不能重复！")
-                return
+            # 检查快捷键冲突（逐个检查，发现重复立即退出）
+            seen = set()
+            for hotkey in (single_key, continuous_key, stop_key):
+                if hotkey in seen:
+                    messagebox.showerror("错误", "快捷键不能重复！")
+                    return
+                seen.add(hotkey)
             
             # 停止当前快捷键监听
             stop_hotkey_service()
@@ -1136,13 +1165,13 @@ class MainWindow:
         """在指定区域检测圆形"""
         def detect_task():
             try:
-                self.root.after(0, lambda: self.update_status("正在检测圆形..."))
+                self.root.after(0, self.update_status, "正在检测圆形...")
                 
                 # 检查OpenCV是否可用
                 try:
                     import cv2
                 except ImportError as e:
-                    self.root.after(0, lambda: self.update_status("圆形检测功能需要OpenCV，请安装: pip install opencv-python"))
+                    self.root.after(0, self.update_status, "圆形检测功能需要OpenCV，请安装: pip install opencv-python")
                     return
                 
                 # 获取截图区域
@@ -1161,18 +1190,18 @@ class MainWindow:
                 # 截取区域图像到临时路径
                 region_screenshot = screenshot_manager.capture_single(save_path=temp_screenshot_path)
                 if not region_screenshot:
-                    self.root.after(0, lambda: self.update_status("截图失败，请检查截图功能是否正常"))
+                    self.root.after(0, self.update_status, "截图失败，请检查截图功能是否正常")
                     return
                 
                 # 验证文件是否存在
                 if not os.path.exists(region_screenshot['file_path']):
-                    self.root.after(0, lambda: self.update_status(f"临时截图文件创建失败: {region_screenshot['file_path']}"))
+                    self.root.after(0, self.update_status, f"临时截图文件创建失败: {region_screenshot['file_path']}")
                     return
                 
                 # 读取图像文件进行检测
                 image = cv2.imread(region_screenshot['file_path'])
                 if image is None:
-                    self.root.after(0, lambda: self.update_status(f"图像读取失败，文件可能损坏: {region_screenshot['file_path']}"))
+                    self.root.after(0, self.update_status, f"图像读取失败，文件可能损坏: {region_screenshot['file_path']}")
                     # 清理临时文件
                     try:
                         os.remove(region_screenshot['file_path'])
@@ -1207,15 +1236,15 @@ class MainWindow:
                 # 如果检测到圆形，自动更新自定义圆形参数为第一个检测到的圆形
                 if global_circles:
                     first_circle = global_circles[0]
-                    self.root.after(0, lambda: self.custom_circle_x_var.set(str(first_circle.x)))
-                    self.root.after(0, lambda: self.custom_circle_y_var.set(str(first_circle.y)))
-                    self.root.after(0, lambda: self.custom_circle_radius_var.set(str(first_circle.radius)))
+                    self.root.after(0, self.custom_circle_x_var.set, str(first_circle.x))
+                    self.root.after(0, self.custom_circle_y_var.set, str(first_circle.y))
+                    self.root.after(0, self.custom_circle_radius_var.set, str(first_circle.radius))
                     # 自动启用自定义圆形截图
-                    self.root.after(0, lambda: self.custom_circle_enabled_var.set(True))
-                    self.root.after(0, lambda: self.toggle_custom_circle())
+                    self.root.after(0, self.custom_circle_enabled_var.set, True)
+                    self.root.after(0, self.toggle_custom_circle)
                 
                 # 在主线程中更新UI
-                self.root.after(0, lambda: self.update_circle_detection_results(len(global_circles)))
+                self.root.after(0, self.update_circle_detection_results, len(global_circles))
                 
                 # 清理临时文件
                 try:
@@ -1230,7 +1259,7 @@ class MainWindow:
                         os.remove(region_screenshot['file_path'])
                 except:
                     pass
-                self.root.after(0, lambda: self.update_status(f"圆形检测失败: {e}"))
+                self.root.after(0, self.update_status, f"圆形检测失败: {e}")
         
         # 在后台线程中执行检测
         import threading
@@ -1244,19 +1273,19 @@ class MainWindow:
         
         def capture_task():
             try:
-                self.root.after(0, lambda: self.update_status("正在截图圆形..."))
+                self.root.after(0, self.update_status, "正在截图圆形...")
                 
                 # 获取全屏截图用于圆形截图
                 full_screenshot_result = screenshot_manager.capture_fullscreen()
                 if not full_screenshot_result:
-                    self.root.after(0, lambda: self.update_status("全屏截图失败"))
+                    self.root.after(0, self.update_status, "全屏截图失败")
                     return
                 
                 # 读取全屏图像
                 import cv2
                 full_image = cv2.imread(full_screenshot_result['file_path'])
                 if full_image is None:
-                    self.root.after(0, lambda: self.update_status("全屏图像读取失败"))
+                    self.root.after(0, self.update_status, "全屏图像读取失败")
                     return
                 
                 # 设置圆形截图保存目录
@@ -1274,13 +1303,13 @@ class MainWindow:
                 # 更新UI显示结果
                 if capture_results["successful_captures"] > 0:
                     success_msg = f"成功截图 {capture_results['successful_captures']} 个圆形"
-                    self.root.after(0, lambda: self.update_status(success_msg))
+                    self.root.after(0, self.update_status, success_msg)
                     self.root.after(0, self.update_file_count)
                 else:
-                    self.root.after(0, lambda: self.update_status("圆形截图失败"))
+                    self.root.after(0, self.update_status, "圆形截图失败")
                 
             except Exception as e:
-                self.root.after(0, lambda: self.update_status(f"圆形截图错误: {e}"))
+                self.root.after(0, self.update_status, f"圆形截图错误: {e}")
         
         # 在后台线程中执行截图
         import threading
@@ -1345,11 +1374,11 @@ class MainWindow:
         
         def on_center_recorded(x, y):
             # 在主线程中更新圆心坐标
-            self.root.after(0, lambda: self._fill_circle_center_coordinate(x, y))
+            self.root.after(0, self._fill_circle_center_coordinate, x, y)
         
         def on_status_changed(message):
             # 在主线程中更新状态
-            self.root.after(0, lambda: self.custom_circle_status_var.set(message))
+            self.root.after(0, self.custom_circle_status_var.set, message)
         
         # 启动单次坐标记录
         if self.coordinate_recorder.start_single_recording(
@@ -1412,11 +1441,11 @@ class MainWindow:
         
         def on_single_recorded(x, y):
             # 在主线程中更新左上角坐标
-            self.root.after(0, lambda: self._fill_topleft_coordinate(x, y))
+            self.root.after(0, self._fill_topleft_coordinate, x, y)
         
         def on_status_changed(message):
             # 在主线程中更新状态
-            self.root.after(0, lambda: self.coord_status_var.set(message))
+            self.root.after(0, self.coord_status_var.set, message)
         
         # 启动单次坐标记录
         if self.coordinate_recorder.start_single_recording(
@@ -1436,11 +1465,11 @@ class MainWindow:
         
         def on_single_recorded(x, y):
             # 在主线程中更新右下角坐标
-            self.root.after(0, lambda: self._fill_bottomright_coordinate(x, y))
+            self.root.after(0, self._fill_bottomright_coordinate, x, y)
         
         def on_status_changed(message):
             # 在主线程中更新状态
-            self.root.after(0, lambda: self.coord_status_var.set(message))
+            self.root.after(0, self.coord_status_var.set, message)
         
         # 启动单次坐标记录
         if self.coordinate_recorder.start_single_recording(
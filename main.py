@@ -8,41 +8,55 @@
 - 全局快捷键支持
 """
 
+import functools
 import sys
 import signal
 import threading
 import os
 
-# 全局变量用于GUI模块
-tk = None
-messagebox = None
-create_main_window = None
-
+@functools.lru_cache(maxsize=1)
 def _import_gui_modules():
-    """延迟导入GUI模块"""
-    global tk, messagebox, create_main_window
+    """延迟导入GUI模块，成功返回窗口工厂函数，失败返回None
+
+    结果会被缓存，重试路径上再次调用只是一次字典查找，
+    不会重复执行导入和失败提示。
+    """
     try:
-        import tkinter as _tk
-        from tkinter import messagebox as _messagebox
-        from gui.main_window import create_main_window as _create_main_window
-        
-        tk = _tk
-        messagebox = _messagebox
-        create_main_window = _create_main_window
-        return True
+        import tkinter  # noqa: F401  仅探测GUI环境是否可用
+        from gui.main_window import create_main_window
+        return create_main_window
     except ImportError as e:
         print(f"警告: GUI模块导入失败 - {e}")
         print("这通常发生在WSL或无图形环境中")
         print("请尝试运行: python minimal_test.py")
-        return False
+        return None
 
-# 导入非GUI模块
-from core.screenshot import screenshot_manager
+# 配置模块轻量（仅依赖json），保持立即导入
 from core.config import config_manager
-from core.hotkey import hotkey_manager, register_screenshot_hotkeys, start_hotkey_service, stop_hotkey_service
-from core.circle_detection import circle_detector
-from core.circle_capture import circle_capture
-from utils.file_manager import file_manager
+
+# 重量级核心模块（pyautogui/pynput/cv2等）延迟到首次使用时导入，
+# 避免在GUI窗口出现前付出数百毫秒的冷启动开销
+_LAZY_ATTRS = {
+    'screenshot_manager': ('core.screenshot', 'screenshot_manager'),
+    'hotkey_manager': ('core.hotkey', 'hotkey_manager'),
+    'register_screenshot_hotkeys': ('core.hotkey', 'register_screenshot_hotkeys'),
+    'start_hotkey_service': ('core.hotkey', 'start_hotkey_service'),
+    'stop_hotkey_service': ('core.hotkey', 'stop_hotkey_service'),
+    'circle_detector': ('core.circle_detection', 'circle_detector'),
+    'circle_capture': ('core.circle_capture', 'circle_capture'),
+    'file_manager': ('utils.file_manager', 'file_manager'),
+}
+
+
+def __getattr__(name):
+    """延迟导入重量级核心模块 (PEP 562)，并缓存到模块全局"""
+    if name in _LAZY_ATTRS:
+        import importlib
+        module_name, attr = _LAZY_ATTRS[name]
+        value = getattr(importlib.import_module(module_name), attr)
+        globals()[name] = value  # 缓存，后续访问不再走__getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class JietuApplication:
@@ -52,28 +66,39 @@ class JietuApplication:
         self.main_window = None
         self.hotkey_initialized = False
         self.gui_available = False
+        self._cleaned_up = False
         
     def initialize_managers(self):
         """初始化各个管理器"""
         try:
-            # 加载配置
-            config_manager.load_config()
-            
-            # 初始化截图管理器
+            from core.screenshot import screenshot_manager
+            from utils.file_manager import file_manager
+
+            # 配置已在ConfigManager构造时加载，这里无需再次读取JSON
+
+            # 一次性读取配置到局部变量，避免重复走配置字典查找
             region = config_manager.get_screenshot_region()
+            save_dir = config_manager.get_save_directory()
+            interval = config_manager.get_continuous_interval()
+
+            # 初始化截图管理器
             screenshot_manager.set_capture_region(*region)
-            screenshot_manager.set_save_directory(config_manager.get_save_directory())
-            screenshot_manager.set_capture_interval(config_manager.get_continuous_interval())
-            
+            screenshot_manager.set_save_directory(save_dir)
+            screenshot_manager.set_capture_interval(interval)
+
             # 初始化文件管理器
-            file_manager.set_base_directory(config_manager.get_save_directory())
+            file_manager.set_base_directory(save_dir)
             
             # 初始化圆形检测和截图功能
+            # 只有启用时才导入circle模块，避免加载cv2/numpy
             if config_manager.is_circle_detection_enabled():
+                from core.circle_capture import circle_capture
+                from core.circle_detection import circle_detector
+
                 # 设置圆形截图保存目录
                 circle_save_dir = config_manager.get_circle_images_directory()
                 circle_capture.set_save_directory(circle_save_dir)
-                
+
                 # 应用检测参数
                 hough_params = config_manager.get_hough_params()
                 from core.circle_detection import DetectionParams
@@ -95,21 +120,17 @@ class JietuApplication:
     def create_gui(self):
         """创建GUI界面"""
         # 首先尝试导入GUI模块
-        if not _import_gui_modules():
+        window_factory = _import_gui_modules()
+        if window_factory is None:
             print("错误: 无法导入GUI模块")
             print("解决方案:")
             print("1. 在Linux/WSL中安装: sudo apt-get install python3-tk python3-dev")
             print("2. 或者运行核心功能测试: python minimal_test.py")
             return False
-            
-        # 确保 create_main_window 可用
-        if not create_main_window:
-            print("错误: GUI函数未能成功导入。")
-            return False
-            
+
         try:
             self.gui_available = True
-            self.main_window = create_main_window()
+            self.main_window = window_factory()
             if self.main_window is None:
                 print("错误: create_main_window返回None")
                 return False
@@ -120,23 +141,32 @@ class JietuApplication:
     
     def setup_signal_handlers(self):
         """设置信号处理器"""
-        def signal_handler(signum, frame):
-            print("接收到退出信号，正在清理...")
-            self.cleanup()
-            sys.exit(0)
-        
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
-    
+        signal.signal(signal.SIGINT, self._on_signal)
+        signal.signal(signal.SIGTERM, self._on_signal)
+
+    def _on_signal(self, signum, frame):
+        """信号处理：清理资源后退出"""
+        print("接收到退出信号，正在清理...")
+        self.cleanup()
+        sys.exit(0)
+
     def cleanup(self):
-        """清理资源"""
+        """清理资源（幂等，信号处理与run的finally可能先后调用）"""
+        if self._cleaned_up:
+            return
+        self._cleaned_up = True
+
         try:
-            # 停止连续截图
-            if screenshot_manager.is_continuous_capturing():
+            # 停止连续截图（仅当截图模块已被加载时）
+            # stop_continuous_capture本身对未在截图的情况是安全的空操作，
+            # 无需先查询is_continuous_capturing再停止
+            if 'core.screenshot' in sys.modules:
+                from core.screenshot import screenshot_manager
                 screenshot_manager.stop_continuous_capture()
-            
+
             # 停止快捷键服务
             if self.hotkey_initialized:
+                from core.hotkey import stop_hotkey_service
                 stop_hotkey_service()
             
             # 保存配置
@@ -4,31 +4,52 @@
 """
 
 import sys
-import subprocess
 import ctypes
 import os
 
+# 管理员权限在进程生命周期内不会变化，查询一次后缓存
+_is_admin_cached = None
+
 def is_admin():
     """检查是否以管理员身份运行"""
-    try:
-        return ctypes.windll.shell32.IsUserAnAdmin()
-    except:
-        return False
+    global _is_admin_cached
+    if _is_admin_cached is None:
+        try:
+            _is_admin_cached = bool(ctypes.windll.shell32.IsUserAnAdmin())
+        except:
+            _is_admin_cached = False
+    return _is_admin_cached
+
+# ShellExecuteW失败返回值（<=32）对应的含义
+_SHELL_EXECUTE_ERRORS = {
+    0: "系统内存或资源不足",
+    2: "找不到指定的文件",
+    3: "找不到指定的路径",
+    5: "访问被拒绝（UAC对话框中选择了'否'）",
+    8: "内存不足",
+    26: "发生共享冲突",
+    31: "没有关联的应用程序",
+    32: "指定的动态链接库未找到",
+}
 
 def run_as_admin(script_path):
     """以管理员身份运行脚本"""
     try:
-        # 使用PowerShell以管理员身份运行
+        # 直接调用Win32 ShellExecuteW发起UAC提权
+        # （PowerShell的Start-Process -Verb RunAs底层就是这个调用，
+        # 没必要为一次系统调用启动整个PowerShell进程）
         # sys.executable确保我们用的是同一个python解释器
-        cmd = f'Start-Process "{sys.executable}" -ArgumentList '
-        cmd += f'"{script_path}" -Verb RunAs'
-        subprocess.run(['powershell', '-Command', cmd], check=True, capture_output=True)
-        return True
+        rc = ctypes.windll.shell32.ShellExecuteW(
+            None, "runas", sys.executable, f'"{script_path}"', None, 1
+        )
+        # ShellExecuteW返回值大于32表示成功
+        if rc > 32:
+            return True
+        reason = _SHELL_EXECUTE_ERRORS.get(rc, str(ctypes.WinError(rc)))
+        print(f"以管理员身份启动失败 (代码{rc}): {reason}")
+        return False
     except Exception as e:
         print(f"以管理员身份启动失败: {e}")
-        # 打印更详细的错误
-        if hasattr(e, 'stderr') and e.stderr:
-            print(f"  错误详情: {e.stderr.decode('gbk', errors='ignore')}")
         return False
 
 def main():
@@ -46,8 +67,12 @@ def main():
             return
 
         try:
-            # 直接运行主程序
-            subprocess.run([sys.executable, script_to_run])
+            # 已经在目标权限下，直接在本进程内运行主程序，
+            # 不再fork一个子python解释器重复整个启动开销
+            import runpy
+            runpy.run_path(script_to_run, run_name="__main__")
+        except SystemExit:
+            pass
         except Exception as e:
             print(f"❌ 启动 {script_to_run} 失败: {e}")
             input("按回车键退出...")
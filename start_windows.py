@@ -7,9 +7,41 @@ Windows系统专用启动脚本
 import sys
 import os
 import platform
-import subprocess
 from pathlib import Path
 
+# 管理员权限在进程生命周期内不会变化，查询一次后缓存
+_is_admin_cached = None
+
+def _is_user_admin():
+    """检查当前进程是否以管理员身份运行（仅Windows有效）"""
+    global _is_admin_cached
+    if _is_admin_cached is None:
+        try:
+            import ctypes
+            _is_admin_cached = ctypes.windll.shell32.IsUserAnAdmin() != 0
+        except:
+            _is_admin_cached = False
+    return _is_admin_cached
+
+def preload_heavy_modules():
+    """后台线程预热重量级依赖
+
+    环境检查和提示信息要打印数秒，趁这段时间把pyautogui/PIL/pynput
+    先导入进sys.modules，start_application时的导入就只剩字典查找。
+    """
+    import threading
+
+    def _warm():
+        for name in ('PIL.Image', 'pyautogui', 'pynput'):
+            try:
+                __import__(name)
+            except Exception:
+                pass  # 缺失的依赖由check_dependencies负责报告
+
+    thread = threading.Thread(target=_warm, daemon=True, name='preload')
+    thread.start()
+    return thread
+
 def check_windows_environment():
     """检查Windows环境"""
     print("🔍 检查Windows环境...")
@@ -23,12 +55,16 @@ def check_windows_environment():
     print(f"✅ Python版本: {sys.version}")
     
     # 检查屏幕分辨率
+    # 直接调用GetSystemMetrics读取两个整数，
+    # 不必为此初始化整个Tcl/Tk解释器。
+    # 注意不能调SetProcessDPIAware：那是进程级且不可逆的开关，
+    # 主程序在同一进程里运行，会改变Tk渲染和截图坐标的缩放语义；
+    # 不调它时GetSystemMetrics返回与winfo_screenwidth一致的虚拟化数值
     try:
-        import tkinter as tk
-        root = tk.Tk()
-        screen_width = root.winfo_screenwidth()
-        screen_height = root.winfo_screenheight()
-        root.destroy()
+        import ctypes
+        user32 = ctypes.windll.user32
+        screen_width = user32.GetSystemMetrics(0)
+        screen_height = user32.GetSystemMetrics(1)
         print(f"✅ 屏幕分辨率: {screen_width}x{screen_height}")
     except Exception as e:
         print(f"⚠️ 无法获取屏幕信息: {e}")
@@ -38,37 +74,41 @@ def check_windows_environment():
 def check_dependencies():
     """检查依赖包"""
     print("\n📦 检查依赖包...")
-    
+
+    import importlib.metadata
+    import importlib.util
+
+    # (说明, pip发行包名)，发行包名为None表示标准库自带、无版本元数据
     required_packages = {
-        'tkinter': '图形界面',
-        'PIL': '图像处理',
-        'pyautogui': '自动化截图',
-        'pynput': '全局快捷键',
+        'tkinter': ('图形界面', None),
+        'PIL': ('图像处理', 'pillow'),
+        'pyautogui': ('自动化截图', 'pyautogui'),
+        'pynput': ('全局快捷键', 'pynput'),
     }
-    
+
     missing_packages = []
-    
-    for package, description in required_packages.items():
-        try:
-            if package == 'tkinter':
-                import tkinter
-            elif package == 'PIL':
-                from PIL import Image
-            elif package == 'pyautogui':
-                import pyautogui
-            elif package == 'pynput':
-                import pynput
-            
-            print(f"  ✅ {package} - {description}")
-        except ImportError:
+
+    for package, (description, dist_name) in required_packages.items():
+        # find_spec只探测包是否存在，不执行包的顶层代码，
+        # 避免仅为检查可用性就付出完整导入的开销
+        if importlib.util.find_spec(package) is not None:
+            version = ''
+            if dist_name:
+                try:
+                    # 版本号从安装元数据读取，同样无需导入包本身
+                    version = f" ({importlib.metadata.version(dist_name)})"
+                except importlib.metadata.PackageNotFoundError:
+                    pass
+            print(f"  ✅ {package}{version} - {description}")
+        else:
             print(f"  ❌ {package} - {description} (缺失)")
             missing_packages.append(package)
-    
+
     if missing_packages:
         print(f"\n⚠️ 缺失依赖包: {', '.join(missing_packages)}")
         print("请运行: uv sync")
         return False
-    
+
     return True
 
 def optimize_windows_settings():
@@ -86,16 +126,10 @@ def optimize_windows_settings():
         
         # 检查UAC和权限
         if os.name == 'nt':
-            try:
-                # 尝试检查是否有管理员权限
-                import ctypes
-                is_admin = ctypes.windll.shell32.IsUserAnAdmin() != 0
-                if is_admin:
-                    print("  ✅ 检测到管理员权限")
-                else:
-                    print("  ℹ️ 非管理员权限运行")
-            except:
-                pass
+            if _is_user_admin():
+                print("  ✅ 检测到管理员权限")
+            else:
+                print("  ℹ️ 非管理员权限运行")
         
         return True
         
@@ -174,7 +208,10 @@ def main():
     print("=" * 60)
     print("🖼️  截图工具 - Windows版启动器")
     print("=" * 60)
-    
+
+    # 趁检查和提示阶段在后台预热重量级依赖
+    preload_heavy_modules()
+
     # 检查环境
     if not check_windows_environment():
         input("\n按回车键退出...")
@@ -3,7 +3,6 @@
 用于记录屏幕坐标，支持单次坐标记录
 """
 
-import threading
 from typing import Callable, Optional
 from pynput import mouse
 
@@ -13,7 +12,9 @@ class CoordinateRecorder:
     
     def __init__(self):
         self.recording = False
-        self.coordinates = []
+        self.last_coordinate = None  # 最近一次记录的(x, y)
+        # 监听器常驻复用：pynput的Listener线程停止后无法重启，
+        # 每次记录都重建线程开销大，这里只建一次，用recording标志门控
         self.mouse_listener = None
         
     def start_single_recording(self, 
@@ -30,43 +31,50 @@ class CoordinateRecorder:
         self.target_description = target_description
         
         self.recording = True
-        self.coordinates.clear()
+        self.last_coordinate = None
         
         try:
             print(f"🎯 启动{target_description}坐标记录...")
-            
-            self.mouse_listener = mouse.Listener(
-                on_click=self._on_mouse_click_single,
-                suppress=False
-            )
-            
-            self.mouse_listener.start()
+
+            if self.mouse_listener is None:
+                self.mouse_listener = mouse.Listener(
+                    on_click=self._on_mouse_click_single,
+                    suppress=False
+                )
+                self.mouse_listener.start()
+
             self._notify_status(f"请点击{target_description}位置")
-            
+
             print(f"✅ 单次坐标记录器已启动")
             return True
-            
+
         except Exception as e:
             print(f"❌ 启动单次坐标记录失败: {e}")
             self.recording = False
             return False
-    
+
     def stop_recording(self):
-        """停止坐标记录"""
+        """停止坐标记录（监听器保持常驻，仅关闭记录开关）"""
         if not self.recording:
             return
-        
+
         try:
-            if self.mouse_listener:
-                self.mouse_listener.stop()
-                self.mouse_listener = None
-            
             self.recording = False
             self._notify_status("")
             print("🛑 坐标记录已停止")
-            
+
         except Exception as e:
             print(f"❌ 停止坐标记录失败: {e}")
+
+    def close(self):
+        """释放常驻的鼠标监听器（程序退出时调用）"""
+        self.recording = False
+        if self.mouse_listener:
+            try:
+                self.mouse_listener.stop()
+            except Exception as e:
+                print(f"❌ 关闭鼠标监听器失败: {e}")
+            self.mouse_listener = None
     
     def _on_mouse_click_single(self, x, y, button, pressed):
         """单次鼠标点击事件处理"""
@@ -76,13 +84,12 @@ class CoordinateRecorder:
         try:
             print(f"🖱️ 记录{self.target_description}坐标: ({x}, {y})")
             
-            self.coordinates.append((x, y))
+            self.last_coordinate = (x, y)
             
             if hasattr(self, 'on_single_recorded') and self.on_single_recorded:
-                threading.Thread(
-                    target=lambda: self.on_single_recorded(x, y), 
-                    daemon=True
-                ).start()
+                # 已经在pynput监听线程上，直接回调即可；
+                # 回调方自己负责转发到GUI线程（root.after）
+                self.on_single_recorded(x, y)
             
             print(f"✅ {self.target_description}坐标记录完成: ({x}, {y})")
             self._notify_status(f"{self.target_description}坐标记录完成")
@@ -95,10 +102,7 @@ class CoordinateRecorder:
     def _notify_status(self, message: str):
         """通知状态变化"""
         if self.on_status_changed:
-            threading.Thread(
-                target=lambda: self.on_status_changed(message), 
-                daemon=True
-            ).start()
+            self.on_status_changed(message)
     
     def is_recording(self) -> bool:
         """检查是否正在记录"""
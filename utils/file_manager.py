@@ -1,35 +1,84 @@
 """文件管理工具模块"""
 
-import shutil
+import atexit
+import os
+import time
+from operator import itemgetter
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional, Tuple
 import re
 
+# 文件名中计数器部分的匹配模式，编译一次供所有调用复用
+_COUNTER_PATTERN = re.compile(r'screenshot_(\d+)_')
+
+# 识别为截图的文件扩展名（小写），endswith接受元组参数
+_IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp', '.gif', '.tiff')
+
+# 文件大小单位，按1024进位；除数与单位一一对应
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+_SIZE_DIVISORS = (1, 1024, 1024 ** 2, 1024 ** 3, 1024 ** 4)
+
+
+def _scandir_files(path):
+    """递归生成目录树下所有文件的DirEntry
+
+    直接复用scandir缓存的文件类型信息，不构造Path对象。
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scandir_files(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                yield entry
+
 
 class FileManager:
     """文件管理器"""
-    
+
+    # 每隔多少次计数器递增才落盘一次（退出时由atexit兜底保存）
+    COUNTER_SAVE_INTERVAL = 32
+
     def __init__(self, base_directory: str = "screenshots"):
         self.base_directory = Path(base_directory)
         self.counter_file = Path("screenshot_counter.txt")
         self._current_counter = 1
+        self._counter_dirty = False  # 内存值是否还未落盘
+        self._known_directories = set()  # 本次运行中已确认存在的目录
+        self._timestamp_cache = (0, '')  # (整秒, 对应的时间戳字符串)
         self.load_counter()
-    
+        # 进程退出时保证内存中的计数器落盘
+        atexit.register(self.save_counter)
+
     def set_base_directory(self, directory: str):
         """设置基础目录"""
         self.base_directory = Path(directory)
+        # 目录可能被外部删除后重设，清空缓存重新确认
+        self._known_directories.clear()
         self.ensure_directory_exists()
-    
+
     def get_base_directory(self) -> str:
         """获取基础目录"""
         return str(self.base_directory)
-    
+
+    def reset_known_directories(self):
+        """清空已确认目录缓存
+
+        目录可能被用户在文件管理器中手动删除，
+        清空后下一次ensure_directory_exists会重新创建。
+        """
+        self._known_directories.clear()
+
     def ensure_directory_exists(self, directory: Optional[str] = None) -> bool:
         """确保目录存在"""
-        target_dir = Path(directory) if directory else self.base_directory
+        # 全程用字符串路径，os.makedirs等价于mkdir(parents=True)，
+        # 省去Path对象的来回构造
+        key = directory if directory else str(self.base_directory)
+        if key in self._known_directories:
+            return True
         try:
-            target_dir.mkdir(parents=True, exist_ok=True)
+            os.makedirs(key, exist_ok=True)
+            self._known_directories.add(key)
             return True
         except Exception as e:
             print(f"创建目录失败: {e}")
@@ -37,33 +86,43 @@ class FileManager:
     
     def load_counter(self):
         """从文件加载计数器"""
+        # 直接尝试打开，文件不存在与内容损坏统一走异常路径，
+        # 免去一次额外的exists()系统调用
         try:
-            if self.counter_file.exists():
-                with open(self.counter_file, 'r') as f:
-                    self._current_counter = int(f.read().strip())
-            else:
-                self._current_counter = 1
+            with open(self.counter_file, 'r') as f:
+                self._current_counter = int(f.read().strip())
         except Exception:
             self._current_counter = 1
     
     def save_counter(self):
-        """保存计数器到文件"""
+        """保存计数器到文件（内存值与磁盘一致时直接跳过）"""
+        if not self._counter_dirty:
+            return
         try:
-            with open(self.counter_file, 'w') as f:
+            # 先写临时文件再原子替换，写入中途崩溃不会留下
+            # 空的计数器文件（load_counter会把空文件当作1重新开始）
+            tmp_path = self.counter_file.with_suffix('.tmp')
+            with open(tmp_path, 'w') as f:
                 f.write(str(self._current_counter))
+            os.replace(tmp_path, self.counter_file)
+            self._counter_dirty = False
         except Exception as e:
             print(f"保存计数器失败: {e}")
-    
+
     def get_next_counter(self) -> int:
         """获取下一个计数器值"""
         current = self._current_counter
         self._current_counter += 1
-        self.save_counter()
+        self._counter_dirty = True
+        # 连续截图时逐次写盘开销大，按批持久化即可
+        if self._current_counter % self.COUNTER_SAVE_INTERVAL == 0:
+            self.save_counter()
         return current
-    
+
     def reset_counter(self, start_value: int = 1):
         """重置计数器"""
         self._current_counter = start_value
+        self._counter_dirty = True
         self.save_counter()
     
     def generate_filename(self, 
@@ -83,28 +142,44 @@ class FileManager:
         Returns:
             生成的文件名
         """
+        extension = extension.lstrip('.')
+
+        # 临时文件/预览等不带计数器和时间戳的调用走捷径，
+        # 不触碰计数器（及其落盘逻辑）
+        if not include_counter and not include_timestamp:
+            return f"{prefix}.{extension}"
+
         parts = [prefix]
-        
+
         if include_counter:
             counter = self.get_next_counter()
             parts.append(f"{counter:04d}")
-        
+
         if include_timestamp:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            parts.append(timestamp)
-        
-        filename = "_".join(parts) + f".{extension.lstrip('.')}"
-        return filename
+            parts.append(self._timestamp_str())
+
+        return "_".join(parts) + f".{extension}"
+
+    def _timestamp_str(self) -> str:
+        """当前时间戳字符串，精确到秒
+
+        时间戳粒度就是一秒，同一秒内的连续截图复用缓存结果，
+        不重复走strftime的本地化格式化。
+        """
+        sec = int(time.time())
+        cached_sec, cached_str = self._timestamp_cache
+        if sec != cached_sec:
+            cached_str = time.strftime("%Y%m%d_%H%M%S")
+            self._timestamp_cache = (sec, cached_str)
+        return cached_str
     
     def get_full_path(self, filename: str, subdirectory: Optional[str] = None) -> str:
         """获取完整文件路径"""
-        if subdirectory:
-            directory = self.base_directory / subdirectory
-        else:
-            directory = self.base_directory
-        
-        self.ensure_directory_exists(str(directory))
-        return str(directory / filename)
+        base = str(self.base_directory)
+        directory = os.path.join(base, subdirectory) if subdirectory else base
+
+        self.ensure_directory_exists(directory)
+        return os.path.join(directory, filename)
     
     def get_screenshot_files(self, directory: Optional[str] = None) -> List[Tuple[str, str, float]]:
         """
@@ -116,27 +191,35 @@ class FileManager:
         Returns:
             文件信息列表，每个元素为 (文件名, 完整路径, 修改时间)
         """
+        # 按修改时间排序（最新的在前），itemgetter比lambda少一层Python调用
+        return sorted(self.iter_screenshot_files(directory),
+                      key=itemgetter(2), reverse=True)
+
+    def iter_screenshot_files(self, directory: Optional[str] = None):
+        """惰性遍历目录中的截图文件
+
+        逐个生成 (文件名, 完整路径, 修改时间)，不排序也不整体驻留内存，
+        只关心单个文件的调用方可以提前退出。
+        """
         target_dir = Path(directory) if directory else self.base_directory
-        
-        if not target_dir.exists():
-            return []
-        
-        image_extensions = {'.png', '.jpg', '.jpeg', '.bmp', '.gif', '.tiff'}
-        files = []
-        
+
         try:
-            for file_path in target_dir.iterdir():
-                if file_path.is_file() and file_path.suffix.lower() in image_extensions:
-                    stat = file_path.stat()
-                    files.append((file_path.name, str(file_path), stat.st_mtime))
-            
-            # 按修改时间排序（最新的在前）
-            files.sort(key=lambda x: x[2], reverse=True)
-            
+            # scandir的DirEntry缓存了文件类型和stat信息，
+            # 比iterdir+逐个Path.stat少一轮系统调用；
+            # 目录不存在直接走FileNotFoundError，省去exists()预检
+            with os.scandir(target_dir) as entries:
+                for entry in entries:
+                    # 先做纯内存的扩展名判断，再做可能触发stat的is_file；
+                    # follow_symlinks=False走readdir的d_type快速路径
+                    if entry.name.lower().endswith(_IMAGE_EXTENSIONS) \
+                            and entry.is_file(follow_symlinks=False):
+                        yield (entry.name, entry.path,
+                               entry.stat(follow_symlinks=False).st_mtime)
+
+        except FileNotFoundError:
+            pass
         except Exception as e:
             print(f"读取文件列表失败: {e}")
-        
-        return files
     
     def delete_file(self, file_path: str) -> bool:
         """删除文件"""
@@ -166,11 +249,16 @@ class FileManager:
         # 计算需要删除的文件
         files_to_delete = files[max_files:]
         deleted_count = 0
-        
+
         for _, file_path, _ in files_to_delete:
-            if self.delete_file(file_path):
+            # 路径来自刚完成的扫描，直接os.unlink，
+            # 不经过delete_file的Path构造
+            try:
+                os.unlink(file_path)
                 deleted_count += 1
-        
+            except OSError as e:
+                print(f"删除文件失败: {e}")
+
         return deleted_count
     
     def create_date_subdirectory(self) -> str:
@@ -196,28 +284,42 @@ class FileManager:
             return 0
         
         moved_count = 0
-        image_extensions = {'.png', '.jpg', '.jpeg', '.bmp', '.gif', '.tiff'}
-        
+        created_dates = set()  # 已确认存在的日期目录，避免重复mkdir
+
         try:
-            for file_path in source_dir.iterdir():
-                if file_path.is_file() and file_path.suffix.lower() in image_extensions:
-                    # 获取文件的修改日期
-                    mod_time = datetime.fromtimestamp(file_path.stat().st_mtime)
-                    date_str = mod_time.strftime("%Y-%m-%d")
-                    
-                    # 创建日期目录
-                    date_dir = source_dir / date_str
+            # 先收集条目再移动，避免在迭代中修改目录内容
+            with os.scandir(source_dir) as it:
+                entries = [e for e in it
+                           if e.name.lower().endswith(_IMAGE_EXTENSIONS)
+                           and e.is_file(follow_symlinks=False)]
+
+            for entry in entries:
+                # 获取文件的修改日期
+                date_str = time.strftime(
+                    "%Y-%m-%d", time.localtime(entry.stat(follow_symlinks=False).st_mtime))
+
+                # 创建日期目录（每个日期只创建一次）
+                date_dir = source_dir / date_str
+                if date_str not in created_dates:
                     self.ensure_directory_exists(str(date_dir))
-                    
-                    # 移动文件
-                    new_path = date_dir / file_path.name
-                    if not new_path.exists():  # 避免覆盖
-                        shutil.move(str(file_path), str(new_path))
+                    created_dates.add(date_str)
+
+                # 移动文件：目标在同一目录树下，os.rename即可，
+                # 不需要shutil.move的跨设备拷贝回退。
+                # Windows上rename遇到同名文件会抛FileExistsError，
+                # 正好代替移动前的exists()探测；POSIX的rename会静默
+                # 覆盖同名目标，必须保留exists()预检（避免覆盖）
+                new_path = date_dir / entry.name
+                try:
+                    if os.name == 'nt' or not new_path.exists():
+                        os.rename(entry.path, new_path)
                         moved_count += 1
-        
+                except FileExistsError:
+                    pass
+
         except Exception as e:
             print(f"整理文件失败: {e}")
-        
+
         return moved_count
     
     def get_directory_size(self, directory: Optional[str] = None) -> int:
@@ -237,24 +339,24 @@ class FileManager:
         
         total_size = 0
         try:
-            for file_path in target_dir.rglob('*'):
-                if file_path.is_file():
-                    total_size += file_path.stat().st_size
+            # 递归scandir让每个文件的大小直接读DirEntry缓存的stat，
+            # 不再按路径重新stat一次
+            for entry in _scandir_files(target_dir):
+                total_size += entry.stat(follow_symlinks=False).st_size
         except Exception as e:
             print(f"计算目录大小失败: {e}")
-        
+
         return total_size
     
     def format_file_size(self, size_bytes: int) -> str:
         """格式化文件大小"""
         if size_bytes < 1024:
             return f"{size_bytes} B"
-        elif size_bytes < 1024 * 1024:
-            return f"{size_bytes / 1024:.1f} KB"
-        elif size_bytes < 1024 * 1024 * 1024:
-            return f"{size_bytes / (1024 * 1024):.1f} MB"
-        else:
-            return f"{size_bytes / (1024 * 1024 * 1024):.1f} GB"
+
+        # 1024的幂对应每10个二进制位，bit_length直接算出单位下标，
+        # 无需逐级比较
+        index = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+        return f"{size_bytes / _SIZE_DIVISORS[index]:.1f} {_SIZE_UNITS[index]}"
     
     def find_next_available_counter(self, directory: Optional[str] = None) -> int:
         """
@@ -266,23 +368,27 @@ class FileManager:
         Returns:
             下一个可用的计数器值
         """
-        files = self.get_screenshot_files(directory)
-        existing_counters = set()
-        
-        # 正则表达式匹配文件名中的计数器
-        counter_pattern = re.compile(r'screenshot_(\d+)_')
-        
-        for filename, _, _ in files:
-            match = counter_pattern.search(filename)
-            if match:
-                counter = int(match.group(1))
-                existing_counters.add(counter)
-        
-        # 找到最大值并返回下一个
-        if existing_counters:
-            return max(existing_counters) + 1
-        else:
-            return 1
+        target_dir = Path(directory) if directory else self.base_directory
+        max_counter = 0
+
+        # 只需要文件名就能提取计数器，不必像get_screenshot_files
+        # 那样逐个stat取mtime再排序
+        try:
+            with os.scandir(target_dir) as entries:
+                for entry in entries:
+                    # 计数器固定在文件名开头，match锚定起始位置即可，
+                    # 不必search整个文件名；只关心最大值，无需收集集合
+                    match = _COUNTER_PATTERN.match(entry.name)
+                    if match:
+                        counter = int(match.group(1))
+                        if counter > max_counter:
+                            max_counter = counter
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"读取文件列表失败: {e}")
+
+        return max_counter + 1
 
 
 # 全局文件管理器实例
@@ -0,0 +1,476 @@
+"""图像信息分析模块 - 读取图像文件的基本信息、内存需求与兼容性"""
+
+import functools
+import os
+import stat
+import time
+from typing import Dict, Any, Optional
+
+# 重量级依赖全部延迟导入：cv2冷启动要数百毫秒，
+# 分析器在一次会话中可能根本用不到，导入成本只在首次调用时支付
+
+
+@functools.lru_cache(maxsize=None)
+def _load_pil():
+    """延迟导入PIL.Image模块，不可用时返回None"""
+    try:
+        from PIL import Image
+        return Image
+    except ImportError:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _load_cv2():
+    """延迟导入cv2模块，不可用时返回None"""
+    try:
+        import cv2
+        return cv2
+    except ImportError:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _load_psutil():
+    """延迟导入psutil模块，不可用时返回None"""
+    try:
+        import psutil
+        return psutil
+    except ImportError:
+        return None
+
+
+# 系统内存快照缓存：virtual_memory()每次都要解析/proc/meminfo，
+# 批量分析时内存状况在短时间内不会有意义变化
+_MEM_SNAPSHOT_TTL = 2.0
+_mem_snapshot = (0.0, None)
+
+
+def _sys_mem_snapshot():
+    """获取 (总内存, 可用内存)，带TTL缓存；psutil不可用时返回None"""
+    global _mem_snapshot
+    now = time.monotonic()
+    cached_at, snapshot = _mem_snapshot
+    if snapshot is None or now - cached_at > _MEM_SNAPSHOT_TTL:
+        psutil = _load_psutil()
+        if psutil is None:
+            return None
+        try:
+            vm = psutil.virtual_memory()
+        except Exception as e:
+            print(f"读取系统内存信息失败: {e}")
+            return None
+        snapshot = (vm.total, vm.available)
+        _mem_snapshot = (now, snapshot)
+    return snapshot
+
+
+# PIL图像模式对应的通道数，头信息即可确定，无需解码像素
+_MODE_CHANNELS = {
+    '1': 1, 'L': 1, 'P': 1, 'LA': 2,
+    'RGB': 3, 'YCbCr': 3,
+    'RGBA': 4, 'CMYK': 4, 'I': 1, 'F': 1,
+}
+
+# 各模式对应的像素数据类型
+_MODE_DTYPES = {'I': 'int32', 'F': 'float32'}
+
+# cv2直接读不了但可经PIL转换处理的格式（PIL格式名，大写）
+_CV2_CONVERTIBLE_FORMATS = {'PNG', 'JPEG', 'BMP', 'TIFF', 'WEBP', 'GIF'}
+
+# img.info中可能是KB~MB级二进制负载的键，
+# 元数据结果只记录它们的大小，不携带内容
+_BULKY_INFO_KEYS = frozenset({'icc_profile', 'exif', 'xmp', 'photoshop'})
+
+# 支持分析的图像格式（扩展名 -> 格式说明）
+_SUPPORTED_FORMATS = {
+    '.png': 'PNG图像',
+    '.jpg': 'JPEG图像',
+    '.jpeg': 'JPEG图像',
+    '.bmp': 'BMP位图',
+    '.gif': 'GIF图像',
+    '.tiff': 'TIFF图像',
+    '.tif': 'TIFF图像',
+    '.webp': 'WebP图像',
+}
+
+# psutil不可用时的解码内存预算：读不到真实可用内存，
+# 按2GB保守预算判断too_large_for_decode，保证该标志始终存在
+_FALLBACK_DECODE_BUDGET = 2 * 1024 ** 3
+
+# 各模式每像素位数；用位数而不是字节数，
+# 1位模式也能走纯整数运算（字节数向上取整）
+_BITS_PER_PIXEL = {
+    '1': 1, 'L': 8, 'P': 8, 'LA': 16,
+    'RGB': 24, 'YCbCr': 24, 'RGBA': 32, 'CMYK': 32,
+    'I': 32, 'F': 32,
+}
+
+
+class ImageInfoAnalyzer:
+    """图像信息分析器"""
+
+    def analyze_image_file(self, file_path: str,
+                           detail_level: str = 'quick') -> Dict[str, Any]:
+        """
+        分析图像文件，返回完整信息
+
+        Args:
+            file_path: 图像文件路径
+            detail_level: 'quick'跳过EXIF完整遍历和info复制，
+                          'full'提取全部元数据
+
+        Returns:
+            包含文件信息、图像信息、内存需求、兼容性与建议的字典
+        """
+        # 以 (绝对路径, mtime, 大小) 为键缓存结果：
+        # 文件没变时重复分析直接命中，不再反复打开文件
+        try:
+            stat_result = os.stat(file_path)
+        except OSError as e:
+            return {"file_path": file_path, "status": "error", "error": str(e)}
+
+        return self._analyze_cached(os.path.abspath(file_path),
+                                    stat_result.st_mtime_ns,
+                                    stat_result.st_size,
+                                    detail_level)
+
+    @functools.lru_cache(maxsize=256)
+    def _analyze_cached(self, file_path: str, mtime_ns: int, size: int,
+                        detail_level: str) -> Dict[str, Any]:
+        """执行实际分析；mtime_ns/size只参与缓存键，文件改动即失效
+
+        注意返回的是缓存共享的字典，调用方不应原地修改。
+        """
+        result = {
+            "file_path": file_path,
+            "analyzed_at": time.time(),
+            "status": "ok",
+        }
+
+        try:
+            result["file_info"] = self._get_file_info(file_path)
+
+            # 明显不是图像的文件（.txt/.mp4等）不值得让PIL去读头再抛异常
+            if result["file_info"]["extension"] not in _SUPPORTED_FORMATS:
+                result["image_info"] = {"unsupported_extension": True}
+                return result
+
+            # PIL只打开一次，头信息/EXIF/兼容性共用同一份探测结果
+            probe = self._probe_pil(file_path, detail_level)
+
+            result["image_info"] = self._get_image_info(probe)
+            result["memory_requirements"] = self._calculate_memory_requirements(
+                result["image_info"])
+            result["compatibility"] = self._check_compatibility(
+                file_path, probe,
+                result["memory_requirements"].get("too_large_for_decode", False))
+            result["metadata"] = self._get_metadata(probe)
+            result["recommendations"] = self._generate_recommendations(
+                result["image_info"],
+                result["memory_requirements"],
+                result["compatibility"],
+            )
+        except Exception as e:
+            print(f"分析图像文件失败: {e}")
+            result["status"] = "error"
+            result["error"] = str(e)
+
+        return result
+
+    def _get_file_info(self, file_path: str) -> Dict[str, Any]:
+        """获取文件系统层面的信息"""
+        stat_result = os.stat(file_path)
+        # 纯字符串路径操作，不构造Path对象；
+        # 调用方传入的已是绝对路径时abspath的getcwd也省掉
+        filename = os.path.basename(file_path)
+        extension = os.path.splitext(filename)[1].lower()
+        # 读写权限直接看st_mode位，省掉两次os.access系统调用
+        mode = stat_result.st_mode
+
+        return {
+            "filename": filename,
+            "extension": extension,
+            "directory": os.path.dirname(file_path),
+            "absolute_path": (file_path if os.path.isabs(file_path)
+                              else os.path.abspath(file_path)),
+            "size_bytes": stat_result.st_size,
+            "size_mb": round(stat_result.st_size / (1024 * 1024), 3),
+            # 存原始时间戳，展示层需要时再格式化（当前没有调用方展示）
+            "created": stat_result.st_ctime,
+            "modified": stat_result.st_mtime,
+            "readable": bool(mode & stat.S_IRUSR),
+            "writable": bool(mode & stat.S_IWUSR),
+            "format_description": _SUPPORTED_FORMATS.get(extension, "未知格式"),
+        }
+
+    def _probe_pil(self, file_path: str,
+                   detail_level: str = 'quick') -> Dict[str, Any]:
+        """用一次PIL打开收集所有后续步骤需要的数据
+
+        只读取文件头：PIL的open不会解码像素数据，
+        尺寸/模式/格式都来自头信息，避免为读宽高分配整幅像素缓冲。
+        各分析步骤复用这一份结果，不再各自重新打开文件。
+        EXIF的完整遍历和info字典复制只在detail_level='full'时进行。
+        """
+        probe: Dict[str, Any] = {"open_ok": False}
+
+        PILImage = _load_pil()
+        if PILImage is None:
+            probe["error"] = "PIL不可用"
+            return probe
+
+        # 只在这一次头读取期间解除解压炸弹上限（超大图也要能量尺寸），
+        # 随后立即恢复，不动进程里其他PIL使用方的防护；
+        # 分析器本身不解码，能否解码由too_large_for_decode标志判断
+        original_limit = PILImage.MAX_IMAGE_PIXELS
+        PILImage.MAX_IMAGE_PIXELS = None
+        try:
+            with PILImage.open(file_path) as img:
+                probe["open_ok"] = True
+                probe["width"], probe["height"] = img.size
+                probe["mode"] = img.mode
+                probe["format"] = img.format
+                if detail_level == 'full':
+                    # _getexif会遍历整棵EXIF IFD树，按需才取；
+                    # 大块二进制负载不进结果字典（批量分析时这些字典
+                    # 还要跨进程pickle），只记录各负载的字节数
+                    info = img.info
+                    probe["info"] = {k: v for k, v in info.items()
+                                     if k not in _BULKY_INFO_KEYS}
+                    probe["info_sizes"] = {
+                        k: len(v) for k, v in info.items()
+                        if isinstance(v, (bytes, bytearray))}
+                    exif = img._getexif() if hasattr(img, '_getexif') else None
+                    probe["exif_entries"] = len(exif) if exif else 0
+        except Exception as e:
+            print(f"读取图像信息失败: {e}")
+            probe["error"] = str(e)
+        finally:
+            PILImage.MAX_IMAGE_PIXELS = original_limit
+
+        return probe
+
+    def _get_image_info(self, probe: Dict[str, Any]) -> Dict[str, Any]:
+        """从PIL探测结果整理图像信息"""
+        if not probe["open_ok"]:
+            return {"error": probe.get("error", "无法打开图像")}
+
+        width = probe["width"]
+        height = probe["height"]
+        mode = probe["mode"]
+
+        return {
+            "width": width,
+            "height": height,
+            "channels": _MODE_CHANNELS.get(mode, 3),
+            "mode": mode,
+            "dtype": _MODE_DTYPES.get(mode, 'uint8'),
+            "format": probe["format"],
+            "total_pixels": width * height,
+            "megapixels": round(width * height / 1_000_000, 2),
+        }
+
+    def _calculate_memory_requirements(self, image_info: Dict[str, Any]) -> Dict[str, Any]:
+        """根据已解析的图像信息估算解码后的内存需求"""
+        if "error" in image_info:
+            return {"error": image_info["error"]}
+
+        width = image_info["width"]
+        height = image_info["height"]
+        bits = _BITS_PER_PIXEL.get(image_info["mode"], 24)
+        base_memory = (width * height * bits + 7) // 8
+
+        memory_info = {
+            "base_memory_bytes": base_memory,
+            "base_memory_mb": round(base_memory / (1024 * 1024), 2),
+            # 处理过程中通常需要原图+工作副本
+            "working_memory_mb": round(base_memory * 2 / (1024 * 1024), 2),
+        }
+
+        snapshot = _sys_mem_snapshot()
+        if snapshot is not None:
+            total, available = snapshot
+            memory_info["system_total_gb"] = round(total / (1024 ** 3), 2)
+            memory_info["system_available_gb"] = round(available / (1024 ** 3), 2)
+            memory_info["fits_in_memory"] = base_memory * 2 < available
+            decode_budget = available * 0.8
+        else:
+            decode_budget = _FALLBACK_DECODE_BUDGET
+        # 尺寸来自文件头，在真正解码前就能判断会不会把内存吃满
+        memory_info["too_large_for_decode"] = base_memory > decode_budget
+
+        return memory_info
+
+    def _check_compatibility(self, file_path: str, probe: Dict[str, Any],
+                             too_large_for_decode: bool = False) -> Dict[str, Any]:
+        """检查图像与OpenCV处理管线的兼容性"""
+        compatibility = {
+            "pil_loadable": probe["open_ok"],
+            "opencv_loadable": False,
+            "pil_format": probe.get("format"),
+            "fallback_available": False,
+        }
+
+        if not probe["open_ok"] and "error" in probe:
+            compatibility["pil_error"] = probe["error"]
+
+        cv2 = _load_cv2()
+        if cv2 is not None:
+            if too_large_for_decode:
+                # 文件头已表明解码会耗尽内存，
+                # 不能为了探测兼容性就让imread真的去解整幅图
+                compatibility["opencv_skipped"] = "too_large_for_decode"
+                return compatibility
+            try:
+                image = cv2.imread(file_path, cv2.IMREAD_UNCHANGED)
+                if image is not None:
+                    compatibility["opencv_loadable"] = True
+                elif compatibility["pil_loadable"]:
+                    # 判断"能否经PIL转换"只需看格式，
+                    # 不必真的解码整幅图像再cvtColor验证一次
+                    pil_format = probe.get("format") or ''
+                    compatibility["fallback_available"] = (
+                        pil_format.upper() in _CV2_CONVERTIBLE_FORMATS)
+            except Exception as e:
+                compatibility["opencv_error"] = str(e)
+                # 在还持有异常对象时按类型归类，
+                # 建议生成阶段就不用再对错误文本做字符串嗅探
+                compatibility["opencv_error_kind"] = _classify_cv2_error(e, cv2)
+
+        return compatibility
+
+    def _get_metadata(self, probe: Dict[str, Any]) -> Dict[str, Any]:
+        """从PIL探测结果整理图像元数据（EXIF等）"""
+        if not probe["open_ok"]:
+            return {"error": probe.get("error", "无法打开图像")}
+
+        # quick模式下探测阶段没有提取元数据
+        if "exif_entries" not in probe:
+            return {"lazy": True}
+
+        metadata = {"has_exif": probe["exif_entries"] > 0}
+        if metadata["has_exif"]:
+            metadata["exif_entries"] = probe["exif_entries"]
+        metadata["info"] = probe["info"]
+        if probe["info_sizes"]:
+            metadata["info_sizes"] = probe["info_sizes"]
+
+        return metadata
+
+    def _generate_recommendations(self,
+                                  image_info: Dict[str, Any],
+                                  memory_info: Dict[str, Any],
+                                  compatibility_info: Dict[str, Any]) -> list:
+        """根据分析结果生成处理建议"""
+        recommendations = []
+
+        # 大写格式名只算一次；pil_format可能是None（PIL打不开时），
+        # 用or ''兜底避免对None调用upper
+        pil_fmt = (compatibility_info.get("pil_format") or '').upper()
+
+        if image_info.get("megapixels", 0) > 20:
+            recommendations.append("图像超过2000万像素，建议处理前先缩放")
+
+        if memory_info.get("too_large_for_decode"):
+            recommendations.append("图像解码会占满可用内存，请勿直接加载")
+        elif memory_info.get("fits_in_memory") is False:
+            recommendations.append("可用内存可能不足以解码此图像")
+
+        if pil_fmt == "GIF":
+            recommendations.append("GIF为多帧格式，仅分析第一帧")
+
+        if not compatibility_info.get("opencv_loadable"):
+            if compatibility_info.get("fallback_available"):
+                recommendations.append("OpenCV无法直接读取，可经PIL转换处理")
+            elif pil_fmt in ("WEBP", "TIFF"):
+                recommendations.append(
+                    f"{pil_fmt}格式依赖OpenCV编译选项，建议转换为PNG")
+
+        if compatibility_info.get("opencv_error_kind") == 'memory':
+            recommendations.append("OpenCV读取时内存不足，建议缩小图像")
+
+        return recommendations
+
+    def format_info_text(self, analysis: Dict[str, Any]) -> str:
+        """将分析结果格式化为展示文本"""
+        file_info = analysis.get("file_info", {})
+        image_info = analysis.get("image_info", {})
+        recommendations = analysis.get("recommendations", [])
+
+        has_file = bool(file_info)
+        has_image = (image_info and "error" not in image_info
+                     and not image_info.get("unsupported_extension"))
+
+        # 行数有固定上限，直接组装元组后过滤None，
+        # 免去列表的逐行append扩容
+        return "\n".join(filter(None, (
+            f"文件: {file_info.get('filename', '未知')}" if has_file else None,
+            f"格式: {file_info.get('format_description', '未知')}" if has_file else None,
+            f"大小: {file_info.get('size_mb', 0)} MB" if has_file else None,
+            (f"尺寸: {image_info.get('width', 0)}x{image_info.get('height', 0)}"
+             if has_image else None),
+            # 不做千分位分组，megapixels字段已经提供可读的数量级
+            f"像素: {image_info.get('total_pixels', 0)}" if has_image else None,
+            f"模式: {image_info.get('mode', '未知')}" if has_image else None,
+            ("建议: " + "；".join(recommendations)) if recommendations else None,
+        )))
+
+    def analyze_batch(self, paths, detail_level: str = 'quick') -> list:
+        """批量分析多个图像文件
+
+        文件较多时用进程池并行，每个文件的开销主要是头解析和
+        几次系统调用，可随CPU近线性扩展；小批量直接串行，
+        避免进程池的启动成本反而更慢。
+        detail_level与analyze_image_file含义相同，默认'quick'。
+        """
+        paths = list(paths)
+        if len(paths) < 4:
+            return [self.analyze_image_file(p, detail_level) for p in paths]
+
+        import concurrent.futures
+        try:
+            max_workers = min(os.cpu_count() or 1, 8)
+            worker = functools.partial(_analyze_one, detail_level=detail_level)
+            with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+                return list(executor.map(worker, paths, chunksize=8))
+        except Exception as e:
+            print(f"并行分析失败，回退为串行: {e}")
+            return [self.analyze_image_file(p, detail_level) for p in paths]
+
+    def get_quick_image_info(self, file_path: str) -> Optional[str]:
+        """快速获取一行图像信息摘要"""
+        analysis = self.analyze_image_file(file_path)
+        if analysis.get("status") != "ok":
+            return None
+
+        image_info = analysis.get("image_info", {})
+        if "error" in image_info or image_info.get("unsupported_extension"):
+            return None
+
+        return (f"{image_info.get('width', 0)}x{image_info.get('height', 0)} "
+                f"{image_info.get('mode', '?')} "
+                f"{analysis.get('file_info', {}).get('size_mb', 0)}MB")
+
+
+def _classify_cv2_error(exc: Exception, cv2) -> str:
+    """按异常类型把cv2读取失败归类为 memory/io/format/unknown"""
+    if isinstance(exc, MemoryError):
+        return 'memory'
+    if isinstance(exc, OSError):
+        return 'io'
+    if cv2 is not None and isinstance(exc, cv2.error):
+        message = str(exc)
+        if 'alloc' in message or 'memory' in message or 'size' in message:
+            return 'memory'
+        return 'format'
+    return 'unknown'
+
+
+def _analyze_one(path: str, detail_level: str = 'quick') -> Dict[str, Any]:
+    """分析单个文件（模块级函数，进程池需要可pickle的调用目标）"""
+    return image_info_analyzer.analyze_image_file(path, detail_level)
+
+
+# 全局图像信息分析器实例
+image_info_analyzer = ImageInfoAnalyzer()